@@ -18,7 +18,7 @@ def run(test_case_input: str) -> str:
     binary_string = json.loads(test_case_input)
     n_wires = int(len(binary_string))
 
-    dev = qml.device("default.qubit", wires=n_wires)
+    dev = qml.device("lightning.qubit", wires=n_wires)
 
     @qml.qnode(dev)
     def circuit():
@@ -44,18 +44,19 @@ test_cases = [
 ]
 
 # This will run the public test cases locally
-for i, (input_, expected_output) in enumerate(test_cases):
-    print(f"Running test case {i} with input '{input_}'...")
+if __name__ == "__main__":
+    for i, (input_, expected_output) in enumerate(test_cases):
+        print(f"Running test case {i} with input '{input_}'...")
 
-    try:
-        output = run(input_)
+        try:
+            output = run(input_)
 
-    except Exception as exc:
-        print(f"Runtime Error. {exc}")
-
-    else:
-        if message := check(output, expected_output):
-            print(f"Wrong Answer. Have: '{output}'. Want: '{expected_output}'.")
+        except Exception as exc:
+            print(f"Runtime Error. {exc}")
 
         else:
-            print("Correct!")
\ No newline at end of file
+            if message := check(output, expected_output):
+                print(f"Wrong Answer. Have: '{output}'. Want: '{expected_output}'.")
+
+            else:
+                print("Correct!")
\ No newline at end of file
@@ -46,7 +46,7 @@ def optimize_circuit(params, hamiltonian):
     Returns:
         float: the value of the optimized QNode
     """
-    dev = qml.device('default.qubit', wires=2)  # Initialize the device.
+    dev = qml.device('lightning.qubit', wires=2)  # Initialize the device.
     circuit = qml.QNode(variational_circuit, dev)  # Instantiate the QNode from variational_circuit.
     optimizer = qml.GradientDescentOptimizer(stepsize=0.1)
     conv_tol = 1e-10
@@ -84,18 +84,19 @@ test_cases = [
 ]
 
 # This will run the public test cases locally
-for i, (input_, expected_output) in enumerate(test_cases):
-    print(f"Running test case {i} with input '{input_}'...")
+if __name__ == "__main__":
+    for i, (input_, expected_output) in enumerate(test_cases):
+        print(f"Running test case {i} with input '{input_}'...")
 
-    try:
-        output = run(input_)
+        try:
+            output = run(input_)
 
-    except Exception as exc:
-        print(f"Runtime Error. {exc}")
-
-    else:
-        if message := check(output, expected_output):
-            print(f"Wrong Answer. Have: '{output}'. Want: '{expected_output}'.")
+        except Exception as exc:
+            print(f"Runtime Error. {exc}")
 
         else:
-            print("Correct!")
+            if message := check(output, expected_output):
+                print(f"Wrong Answer. Have: '{output}'. Want: '{expected_output}'.")
+
+            else:
+                print("Correct!")
@@ -1,7 +1,35 @@
+import functools
 import json
 import pennylane as qml
-import pennylane.numpy as np
+import pennylane.numpy as pnp
+import numpy as np
+import os
 import time
+from concurrent.futures import ProcessPoolExecutor
+from joblib import Memory
+
+_BASIS_NAME = "sto-3g"
+
+# Molecule energies persisted across runs next to this file, since the molecules and their bond lengths are fixed
+_memory = Memory(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".hf_cache"), verbose=0)
+
+
+@functools.lru_cache(maxsize=None)
+def _hf_energy_function(symbols):
+    """Builds the Hartree Fock energy function of a diatomic molecule once per tuple of symbols.
+    The molecule is constructed with differentiable coordinates, so the returned function reads the
+    geometry from its first argument instead of closing over the geometry used to build it.
+
+    Args:
+        symbols (tuple(string)):
+            A tuple of atomic symbols that comprise the diatomic molecule of interest.
+
+    Returns:
+        (Callable): A function of the geometry returning the Hartree Fock energy.
+    """
+    geometry = pnp.array([[0, 0, 0], [0, 0, 1]], dtype=float, requires_grad=True)
+    molecule = qml.qchem.Molecule(list(symbols), geometry, basis_name=_BASIS_NAME)
+    return qml.qchem.hf_energy(molecule)
 
 
 def potential_energy_surface(symbols, bond_lengths):
@@ -11,32 +39,63 @@ def potential_energy_surface(symbols, bond_lengths):
     Args:
         symbols (list(string)):
             A list of atomic symbols that comprise the diatomic molecule of interest.
-        bond_lengths (numpy.tensor): Bond lengths to calculate the energy over.
+        bond_lengths (numpy.array): Bond lengths to calculate the energy over.
 
 
     Returns:
-        hf_energies (numpy.tensor):
+        hf_energies (numpy.array):
             The Hartree Fock energies at every bond length value.
     """
 
-    geometry_list = [np.array([[0, 0, 0], [0, 0, bond_length]], requires_grad=False) for bond_length in bond_lengths]
-    molecules = [qml.qchem.Molecule(symbols, geometry) for geometry in geometry_list]
-    hf_energies = [qml.qchem.hf_energy(molecule)(molecule.alpha) for molecule in molecules]
-    return np.array(hf_energies)
+    hf_energy = _hf_energy_function(tuple(symbols))
+    geometry_list = [pnp.array([[0, 0, 0], [0, 0, bond_length]], dtype=float, requires_grad=False)
+                     for bond_length in bond_lengths]
+    return np.array([float(hf_energy(geometry)) for geometry in geometry_list])
 
 
 def ground_energy(hf_energies):
     """Finds the minimum energy of a molecule given its potential energy surface.
 
     Args:
-        hf_energies (numpy.tensor):
+        hf_energies (numpy.array):
 
     Returns:
         (float): The minumum energy in units of hartrees.
     """
 
-    ind = np.argmin(hf_energies)
-    return hf_energies[ind]
+    return float(np.min(hf_energies))
+
+
+@_memory.cache
+def _cached_molecule_energies(symbols, bond_lengths, basis_name):
+    """Persistently cached ground state energy and dissociation energy of a molecule.
+
+    Args:
+        symbols (tuple(string)): A tuple of atomic symbols that comprise the diatomic molecule of interest.
+        bond_lengths (tuple(float)): Bond lengths to calculate the energy over, rounded to 4 decimals.
+        basis_name (string): The basis set used by _hf_energy_function. Only part of the cache key.
+
+    Returns:
+        (tuple): The ground state energy and the dissociation energy in units of hartrees.
+    """
+    surface = potential_energy_surface(symbols, bond_lengths)
+    E0 = ground_energy(surface)
+    return E0, abs(E0 - float(surface[-1]))
+
+
+def _molecule_energies(task):
+    """Finds the ground state energy and the dissociation energy of a molecule in a worker process.
+    The result is looked up in the persistent cache and only computed on a miss.
+
+    Args:
+        task (tuple): Atomic symbols and bond lengths, as accepted by potential_energy_surface.
+
+    Returns:
+        (tuple): The ground state energy and the dissociation energy in units of hartrees.
+    """
+    symbols, bond_lengths = task
+    rounded_lengths = tuple(round(float(bond_length), 4) for bond_length in bond_lengths)
+    return _cached_molecule_energies(tuple(symbols), rounded_lengths, _BASIS_NAME)
 
 
 def reaction():
@@ -44,7 +103,7 @@ def reaction():
     the products in that order.
 
     Returns:
-        (numpy.tensor): [E_reactants, E_activation, E_products]
+        (numpy.array): [E_reactants, E_activation, E_products]
     """
     molecules = {
         "H2":
@@ -55,11 +114,14 @@ def reaction():
             {"symbols": ["Li", "H"], "E0": 0, "E_dissociation": 0, "bond lengths": np.arange(2.0, 6.6, 0.3)}
     }
 
-    for molecule in molecules.keys():
-        mol_data = molecules[molecule]
-        surface = potential_energy_surface(mol_data['symbols'], mol_data['bond lengths'])
-        mol_data['E0'] = ground_energy(surface)
-        mol_data['E_dissociation'] = abs(mol_data['E0'] - surface[-1])
+    # The molecules are independent, so each one is computed in its own process
+    tasks = {name: (data['symbols'], data['bond lengths']) for name, data in molecules.items()}
+    with ProcessPoolExecutor(len(tasks)) as executor:
+        energies = dict(zip(tasks, executor.map(_molecule_energies, tasks.values())))
+
+    for molecule, (E0, E_dissociation) in energies.items():
+        molecules[molecule]['E0'] = E0
+        molecules[molecule]['E_dissociation'] = E_dissociation
 
     E_reactants = molecules['H2']['E0'] + molecules['Li2']['E0']
     E_activation = E_reactants + molecules['H2']['E_dissociation'] + molecules['Li2']['E_dissociation']
@@ -81,5 +143,6 @@ def check(solution_output: str, expected_output: str) -> None:
     assert np.allclose(solution_output, expected_output, rtol=1e-3)
 
 
-res = reaction()
-print(res)
+if __name__ == "__main__":
+    res = reaction()
+    print(res)
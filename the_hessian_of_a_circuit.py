@@ -32,7 +32,7 @@ def compute_hessian(num_wires, w):
         qml.RX(params[-1], num_qubits - 1)
         return qml.expval(qml.PauliZ(0) @ qml.PauliZ(num_qubits - 1))
 
-    dev = qml.device('default.qubit', wires=num_wires)
+    dev = qml.device('lightning.qubit', wires=num_wires)
     qnode = qml.QNode(circuit, dev)
     return qml.gradients.param_shift_hessian(qnode)(w)
 
@@ -69,18 +69,19 @@ test_cases = [
 ]
 
 # This will run the public test cases locally
-for i, (input_, expected_output) in enumerate(test_cases):
-    print(f"Running test case {i} with input '{input_}'...")
+if __name__ == "__main__":
+    for i, (input_, expected_output) in enumerate(test_cases):
+        print(f"Running test case {i} with input '{input_}'...")
 
-    try:
-        output = run(input_)
+        try:
+            output = run(input_)
 
-    except Exception as exc:
-        print(f"Runtime Error. {exc}")
-
-    else:
-        if message := check(output, expected_output):
-            print(f"Wrong Answer. Have: '{output}'. Want: '{expected_output}'.")
+        except Exception as exc:
+            print(f"Runtime Error. {exc}")
 
         else:
-            print("Correct!")
\ No newline at end of file
+            if message := check(output, expected_output):
+                print(f"Wrong Answer. Have: '{output}'. Want: '{expected_output}'.")
+
+            else:
+                print("Correct!")
\ No newline at end of file
@@ -1,23 +1,31 @@
+import importlib.util
 import json
 import pennylane as qml
 import pennylane.numpy as np
 
-dev = qml.device("default.qubit", wires=3)
+# qml.qjit requires the optional pennylane-catalyst package, the gradient is computed uncompiled without it
+HAS_CATALYST = importlib.util.find_spec("catalyst") is not None
 
+# lightning.qubit supports adjoint differentiation and is supported by Catalyst
+dev = qml.device("lightning.qubit", wires=3)
 
-@qml.qnode(dev)
+
+@qml.qnode(dev, diff_method="adjoint")
 def circuit(weights):
     ops = [qml.RX, qml.RY, qml.RZ]
     for i in range(weights.shape[0]):
         for j in range(weights.shape[1]):
             ops[j](weights[i, j], j)
-        qml.broadcast(qml.CNOT, wires=range(3), pattern='ring')
+        qml.CNOT([0, 1])
+        qml.CNOT([1, 2])
+        qml.CNOT([2, 0])
     return qml.expval(qml.PauliY(0) @ qml.PauliZ(2))
 
 
 def parameter_shift(weights):
     """Compute the gradient of the variational circuit given by the
-    circuit function using the parameter-shift rule.
+    circuit function. The gradient is exact and is obtained with adjoint
+    differentiation, which is cheaper than the parameter-shift rule.
 
     Args:
         weights (array): An array of floating-point numbers with size (2, 3).
@@ -26,7 +34,11 @@ def parameter_shift(weights):
         array: The gradient of the variational circuit. The shape should match
         the input weights array.
     """
-    return qml.gradients.param_shift(circuit)(weights)
+    return qml.grad(circuit)(weights)
+
+
+if HAS_CATALYST:
+    parameter_shift = qml.qjit(parameter_shift)
 
 
 # These functions are responsible for testing the solution.
@@ -51,18 +63,19 @@ test_cases = [
 ]
 
 # This will run the public test cases locally
-for i, (input_, expected_output) in enumerate(test_cases):
-    print(f"Running test case {i} with input '{input_}'...")
+if __name__ == "__main__":
+    for i, (input_, expected_output) in enumerate(test_cases):
+        print(f"Running test case {i} with input '{input_}'...")
 
-    try:
-        output = run(input_)
+        try:
+            output = run(input_)
 
-    except Exception as exc:
-        print(f"Runtime Error. {exc}")
-
-    else:
-        if message := check(output, expected_output):
-            print(f"Wrong Answer. Have: '{output}'. Want: '{expected_output}'.")
+        except Exception as exc:
+            print(f"Runtime Error. {exc}")
 
         else:
-            print("Correct!")
\ No newline at end of file
+            if message := check(output, expected_output):
+                print(f"Wrong Answer. Have: '{output}'. Want: '{expected_output}'.")
+
+            else:
+                print("Correct!")
\ No newline at end of file